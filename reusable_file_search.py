@@ -12,113 +12,389 @@ Arguments:
     --inline-singles  For each reusable file used exactly once, replace its readfile shortcode
                       with the file's content, then delete the reusable file.
     --delete-unused   Delete reusable Markdown files that are not referenced in any content file.
+    --cache FILE      Cache the shortcodes found in each content file in FILE, and skip
+                      re-reading content files that are unchanged since the previous run.
 """
 
 import argparse
+import json
+import os
 import re
 import sys
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterator, Optional
 
 
-READFILE_PATTERN = re.compile(r'{{<\s*readfile\s+file\s*=\s*"([^"]+)"\s*>}}')
+# The text around the path in a readfile shortcode. Every shortcode pattern below is
+# built from these two pieces so scanning and inlining always agree on the syntax.
+_READFILE_OPEN = r'{{<\s*readfile\s+file\s*=\s*"'
+_READFILE_CLOSE = r'"\s*>}}'
 
+READFILE_PATTERN = re.compile(_READFILE_OPEN + r'([^"]+)' + _READFILE_CLOSE)
+# Byte-level twin of READFILE_PATTERN, used to scan content files without decoding them.
+READFILE_PATTERN_BYTES = re.compile(READFILE_PATTERN.pattern.encode("ascii"))
+# Matches any unfinished start of a readfile shortcode, used to decide whether the
+# end of a chunk must be carried over to the next read.
+READFILE_PREFIX_BYTES = re.compile(
+    rb'{{<\s*(?:r(?:e(?:a(?:d(?:f(?:i(?:l(?:e(?:\s+(?:f(?:i(?:l(?:e(?:\s*(?:=(?:\s*'
+    rb'(?:"[^"]*)?)?)?)?)?)?)?)?)?)?)?)?)?)?)?)?)?'
+)
 
-def is_excluded_reusable_file(path: Path) -> bool:
+# Content files are scanned CHUNK_SIZE bytes at a time.
+CHUNK_SIZE = 64 * 1024
+
+# Content files are only scanned in worker processes when at least
+# PARALLEL_SCAN_MIN_FILES need reading; each worker takes SCAN_CHUNKSIZE at a time.
+PARALLEL_SCAN_MIN_FILES = 256
+SCAN_CHUNKSIZE = 32
+
+# Thread count for the I/O-bound inline and delete phases.
+IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def is_excluded_reusable_file(path: str) -> bool:
     """Return True when a reusable Markdown file should be excluded from audit."""
-    return path.name.lower() in {"readme.md", "index.md"}
+    return os.path.basename(path).lower() in {"readme.md", "index.md"}
 
 
-def is_excluded_content_file(path: Path) -> bool:
+def is_excluded_content_file(path: str) -> bool:
     """Return True when a content Markdown file should be excluded from scanning."""
-    return path.name.lower() == "readme.md"
+    return os.path.basename(path).lower() == "readme.md"
 
 
 def is_excluded_reference(ref: str) -> bool:
     """Return True when a shortcode reference points to an excluded file."""
-    ref_path = Path(ref)
-    file_name = ref_path.name.lower()
+    parts = ref.lower().split("/")
+    file_name = parts[-1]
 
     if file_name == "readme.md":
         return True
 
     # Only ignore index.md when it belongs to a reusable path.
-    if file_name == "index.md" and "reusable" in {part.lower() for part in ref_path.parts}:
+    if file_name == "index.md" and "reusable" in parts:
         return True
 
     return False
 
 
+def resolve_reference(
+    ref: str, by_relative: dict[str, str], by_basename: dict[str, list[str]]
+) -> Optional[str]:
+    """
+    Return the reusable file key that a shortcode reference points to, or None.
+
+    by_relative maps each reusable file's path relative to reusable_dir to its key.
+    The reference matches when it ends with one of those relative paths, whatever
+    project prefix precedes it; the longest such path wins. Otherwise the filename is
+    matched, picking the alphabetically first reusable file with that name.
+    """
+    parts = ref.split("/")
+    for i in range(len(parts)):
+        key = by_relative.get("/".join(parts[i:]))
+        if key is not None:
+            return key
+
+    keys = by_basename.get(parts[-1])
+    return keys[0] if keys else None
+
+
+def _walk_md(root: str) -> Iterator[str]:
+    """
+    Yield the path of every Markdown file under root, recursively.
+
+    Paths use forward slashes, matching how Path.as_posix() would render them.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".md") and entry.is_file():
+                        yield entry.path if os.sep == "/" else entry.path.replace(os.sep, "/")
+        except OSError as exc:
+            print(f"  WARNING: could not list directory: {exc}", file=sys.stderr)
+
+
+def _iter_refs(content_file: str) -> Iterator[str]:
+    """Yield every readfile shortcode path in a content file, reading it in chunks."""
+    with open(content_file, "rb") as fh:
+        buf = bytearray()
+        while True:
+            chunk = fh.read(CHUNK_SIZE)
+            buf += chunk
+            if not chunk:
+                cut = len(buf)
+            else:
+                # Hold back the end of the buffer only while it could still grow into a
+                # readfile shortcode, and scan it again once the next chunk is appended.
+                # Otherwise keep just a trailing "{" or "{{" that may start a split opener.
+                opener = buf.rfind(b"{{<")
+                if opener != -1 and READFILE_PREFIX_BYTES.fullmatch(buf, opener):
+                    cut = opener
+                elif buf.endswith(b"{{"):
+                    cut = len(buf) - 2
+                elif buf.endswith(b"{"):
+                    cut = len(buf) - 1
+                else:
+                    cut = len(buf)
+            # Cheap substring check first: most chunks contain no readfile shortcodes.
+            # When there is a hit, start the regex at the opener just before it rather
+            # than at the top of the buffer.
+            hit = buf.find(b"readfile", 0, cut)
+            if hit != -1:
+                start = buf.rfind(b"{{<", 0, hit)
+                for ref in READFILE_PATTERN_BYTES.findall(buf, hit if start == -1 else start, cut):
+                    yield ref.decode("utf-8")
+            if not chunk:
+                return
+            del buf[:cut]
+
+
+def _scan_one(content_file: str) -> Optional[list[str]]:
+    """
+    Return every readfile shortcode path referenced in a single content file, or None
+    when the file could not be read.
+    """
+    try:
+        return list(_iter_refs(content_file))
+    except (OSError, UnicodeDecodeError) as exc:
+        print(f"  WARNING: could not read {content_file}: {exc}", file=sys.stderr)
+        return None
+
+
+def _load_cache(cache_file: Path) -> dict[str, list]:
+    """
+    Load a scan cache written by _save_cache().
+
+    The cache maps each content file path to [mtime_ns, size, refs]. A missing or
+    unreadable cache is treated as empty.
+    """
+    try:
+        with open(cache_file, encoding="utf-8") as fh:
+            cache = json.load(fh)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as exc:
+        print(f"  WARNING: ignoring unreadable cache {cache_file}: {exc}", file=sys.stderr)
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_cache(cache_file: Path, cache: dict[str, list]) -> None:
+    """Write the scan cache, warning instead of failing if it cannot be written."""
+    try:
+        with open(cache_file, "w", encoding="utf-8") as fh:
+            json.dump(cache, fh)
+    except OSError as exc:
+        print(f"  WARNING: could not write cache {cache_file}: {exc}", file=sys.stderr)
+
+
 def find_usages(
-    reusable_dir: Path, content_dir: Path
-) -> tuple[dict[str, list[str]], set[str]]:
+    reusable_dir: Path, content_dir: Path, cache_file: Optional[Path] = None
+) -> tuple[dict[str, list[str]], set[str], set[str], dict[str, set[str]]]:
     """
     Scan content_dir for readfile shortcodes that reference files in reusable_dir.
 
+    If cache_file is given, the shortcode paths found in each content file are stored
+    there, and content files whose modification time and size are unchanged since the
+    previous run are not read again.
+
     Returns:
-        usages  - dict mapping each known reusable file path to a list of content
-                  files that reference it.
-        missing - set of shortcode paths that were referenced in content files but
-                  could not be matched to any file in reusable_dir.
+        usages        - dict mapping each referenced reusable file path to a list of
+                        content files that reference it. Unreferenced files are absent.
+        missing       - set of shortcode paths that were referenced in content files
+                        but could not be matched to any file in reusable_dir.
+        reusable_keys - set of every reusable file path found in reusable_dir.
+        matched_refs  - dict mapping each referenced reusable file path to the set of
+                        shortcode paths that resolved to it.
     """
     # Collect all reusable files and normalise their paths as they appear in shortcodes.
-    reusable_files: dict[str, Path] = {}
-    for f in reusable_dir.rglob("*.md"):
-        if is_excluded_reusable_file(f):
-            continue
-        # Hugo readfile paths are typically relative to the project root (content/).
-        # Store both the full path and a normalised string for matching.
-        reusable_files[f.as_posix()] = f
+    # Paths stay plain strings from here on; Path objects are only used at the API boundary.
+    reusable_files = [
+        f for f in _walk_md(str(reusable_dir)) if not is_excluded_reusable_file(f)
+    ]
+
+    # Index every reusable file by its path relative to reusable_dir and by its bare
+    # filename, so each reference resolves with a few dict lookups instead of a scan
+    # over every reusable file. Keys are sorted so basename ties resolve the same way
+    # on every run.
+    prefix_len = len(str(reusable_dir).rstrip("/\\")) + 1
+    by_relative: dict[str, str] = {}
+    by_basename: dict[str, list[str]] = defaultdict(list)
+    for key in sorted(reusable_files):
+        by_relative[key[prefix_len:]] = key
+        by_basename[key.rsplit("/", 1)[-1]].append(key)
 
     usages: dict[str, list[str]] = defaultdict(list)
     missing: set[str] = set()
+    matched_refs: dict[str, set[str]] = defaultdict(set)
+
+    content_files = [
+        f for f in _walk_md(str(content_dir)) if not is_excluded_content_file(f)
+    ]
+
+    # Reuse cached shortcode paths for content files that have not changed.
+    scanned: dict[str, Optional[list[str]]] = {}
+    stamps: dict[str, list[int]] = {}
+    if cache_file is not None:
+        cache = _load_cache(cache_file)
+        for content_file in content_files:
+            try:
+                st = os.stat(content_file)
+            except OSError:
+                continue  # _scan_one reports the error
+            stamp = [st.st_mtime_ns, st.st_size]
+            stamps[content_file] = stamp
+            entry = cache.get(content_file)
+            if (
+                isinstance(entry, list)
+                and len(entry) == 3
+                and entry[:2] == stamp
+                and isinstance(entry[2], list)
+                and all(isinstance(ref, str) for ref in entry[2])
+            ):
+                scanned[content_file] = entry[2]
+
+    # Read and scan the remaining content files, in parallel when there are enough of
+    # them to repay starting worker processes.
+    to_scan = [f for f in content_files if f not in scanned]
+    if len(to_scan) >= PARALLEL_SCAN_MIN_FILES:
+        workers = min(os.cpu_count() or 1, -(-len(to_scan) // SCAN_CHUNKSIZE))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            scanned.update(
+                zip(to_scan, executor.map(_scan_one, to_scan, chunksize=SCAN_CHUNKSIZE))
+            )
+    else:
+        scanned.update((f, _scan_one(f)) for f in to_scan)
+
+    # Resolve references here, in content-file order.
+    # Bind the per-reference lookups to locals; this loop runs once per shortcode.
+    usages_get = usages.__getitem__
+    missing_add = missing.add
+    excluded = is_excluded_reference
+    resolve = resolve_reference
+
+    for content_file in content_files:
+        for ref in scanned[content_file] or ():  # e.g. "content/reusable/md/some_file.md"
+            if excluded(ref):
+                continue
 
-    # Pre-populate every known reusable file so files with zero uses still appear.
-    for key in reusable_files:
-        usages.setdefault(key, [])
+            matched_key = resolve(ref, by_relative, by_basename)
 
-    # Walk every Markdown file in the content directory.
-    for content_file in content_dir.rglob("*.md"):
-        if is_excluded_content_file(content_file):
-            continue
+            if matched_key is not None:
+                usages_get(matched_key).append(content_file)
+                matched_refs[matched_key].add(ref)
+            else:
+                # Reference not found among known reusable files — record as missing.
+                missing_add(ref)
 
-        try:
-            text = content_file.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError) as exc:
-            print(f"  WARNING: could not read {content_file}: {exc}", file=sys.stderr)
-            continue
+    if cache_file is not None:
+        _save_cache(
+            cache_file,
+            {
+                f: stamps[f] + [scanned[f]]
+                for f in content_files
+                if f in stamps and scanned[f] is not None
+            },
+        )
 
-        for match in READFILE_PATTERN.finditer(text):
-            ref = match.group(1)  # e.g. "content/reusable/md/some_file.md"
+    return usages, missing, set(reusable_files), matched_refs
 
-            if is_excluded_reference(ref):
-                continue
 
-            # Try to resolve the referenced path against known reusable files.
-            # Match on the suffix of the path so drive/root differences don't matter.
-            matched_key = None
-            for key in reusable_files:
-                if key.endswith(ref) or ref.endswith(key):
-                    matched_key = key
-                    break
-                # Also try matching just the filename portion as a fallback.
-                if Path(ref).name == Path(key).name:
-                    matched_key = key
-                    break
+def _inline_into(
+    location: str, reusable_keys: list[str], matched_refs: dict[str, set[str]]
+) -> list[str]:
+    """
+    Inline the given single-use reusable files into one content file and delete them.
+
+    Returns the log lines describing what was done, for the caller to print.
+    """
+    log: list[str] = []
+    texts: dict[str, str] = {}
+    for reusable_key in reusable_keys:
+        if not os.path.exists(reusable_key):
+            log.append(f"  [SKIP] Reusable file not found on disk: {reusable_key}")
+            continue
 
-            if matched_key is not None:
-                usages[matched_key].append(content_file.as_posix())
-            else:
-                # Reference not found among known reusable files — record as missing.
-                missing.add(ref)
+        try:
+            with open(reusable_key, encoding="utf-8") as fh:
+                texts[reusable_key] = fh.read().rstrip("\n")
+        except (OSError, UnicodeDecodeError) as exc:
+            log.append(f"  [ERROR] Could not read file: {exc}")
+
+    if not texts:
+        return log
+
+    try:
+        with open(location, encoding="utf-8") as fh:
+            content_text = fh.read()
+    except (OSError, UnicodeDecodeError) as exc:
+        log.append(f"  [ERROR] Could not read file: {exc}")
+        return log
+
+    # Map each shortcode path to be replaced to the reusable file it inlines.
+    table = {
+        ref: reusable_key
+        for reusable_key in texts
+        for ref in matched_refs.get(reusable_key, ())
+    }
+    replaced: set[str] = set()
+    parts: list[str] = []
+    last = 0
+
+    if table and "readfile" in content_text:
+        pattern = re.compile(
+            _READFILE_OPEN
+            + "(" + "|".join(re.escape(ref) for ref in table) + ")"
+            + _READFILE_CLOSE
+        )
+        for m in pattern.finditer(content_text):
+            reusable_key = table[m.group(1)]
+            parts.append(content_text[last:m.start()])
+            parts.append(texts[reusable_key])
+            last = m.end()
+            replaced.add(reusable_key)
+
+    for reusable_key in texts:
+        if reusable_key not in replaced:
+            log.append(f"  [SKIP] Could not locate matching shortcode for {reusable_key} in: {location}")
+
+    if not replaced:
+        return log
+
+    parts.append(content_text[last:])
+
+    try:
+        with open(location, "w", encoding="utf-8") as fh:
+            fh.write("".join(parts))
+    except OSError as exc:
+        log.append(f"  [ERROR] File operation failed: {exc}")
+        return log
+
+    # Only delete reusable files whose shortcode was actually replaced.
+    for reusable_key in sorted(replaced):
+        try:
+            os.unlink(reusable_key)
+            log.append(f"  [OK]   {reusable_key}")
+            log.append(f"         inlined into: {location}")
+            log.append(f"         Reusable file deleted.")
+        except OSError as exc:
+            log.append(f"  [ERROR] File operation failed: {exc}")
 
-    return usages, missing
+    return log
 
 
-def inline_singles(usages: dict[str, list[str]]) -> None:
+def inline_singles(usages: dict[str, list[str]], matched_refs: dict[str, set[str]]) -> None:
     """
     For each reusable file used exactly once, inline its content into the referencing
     content file (replacing the readfile shortcode), then delete the reusable file.
+
+    matched_refs maps each reusable file to the shortcode paths that resolved to it,
+    as returned by find_usages().
     """
     candidates = {k: v for k, v in usages.items() if len(v) == 1}
 
@@ -128,55 +404,55 @@ def inline_singles(usages: dict[str, list[str]]) -> None:
 
     print(f"\n[INLINE] Inlining {len(candidates)} file(s) used exactly once:\n")
 
+    # Group candidates by the content file that uses them, so each content file is
+    # read, rewritten in a single regex pass, and written back exactly once.
+    by_content: dict[str, list[str]] = defaultdict(list)
     for reusable_key, locations in sorted(candidates.items()):
-        reusable_path = Path(reusable_key)
-        content_file = Path(locations[0])
-
-        if not reusable_path.exists():
-            print(f"  [SKIP] Reusable file not found on disk: {reusable_key}")
-            continue
-
-        try:
-            reusable_text = reusable_path.read_text(encoding="utf-8")
-            content_text = content_file.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError) as exc:
-            print(f"  [ERROR] Could not read file: {exc}")
-            continue
-
-        # Replace the matching shortcode with the reusable file's content.
-        replaced = False
-
-        def make_replacer(key: str, path: Path) -> re.Pattern:
-            def replacer(m: re.Match) -> str:
-                nonlocal replaced
-                ref = m.group(1)
-                if key.endswith(ref) or ref.endswith(key) or Path(ref).name == path.name:
-                    replaced = True
-                    return reusable_text.rstrip("\n")
-                return m.group(0)
-            return replacer
-
-        new_content = READFILE_PATTERN.sub(make_replacer(reusable_key, reusable_path), content_text)
-
-        if not replaced:
-            print(f"  [SKIP] Could not locate matching shortcode in: {locations[0]}")
-            continue
-
-        try:
-            content_file.write_text(new_content, encoding="utf-8")
-            reusable_path.unlink()
-            print(f"  [OK]   {reusable_key}")
-            print(f"         inlined into: {locations[0]}")
-            print(f"         Reusable file deleted.")
-        except OSError as exc:
-            print(f"  [ERROR] File operation failed: {exc}")
-
-
-def delete_unused(usages: dict[str, list[str]]) -> None:
+        by_content[locations[0]].append(reusable_key)
+
+    # A content file can itself be a single-use reusable file (reusable_dir inside
+    # content_dir), so the task rewriting it would race with the task inlining and
+    # deleting it. Rewrite those nested files serially first, innermost first, so
+    # each is complete before it is inlined into its parent.
+    nested = {loc: keys for loc, keys in sorted(by_content.items()) if loc in candidates}
+    while nested:
+        ready = [
+            loc for loc, keys in nested.items() if not any(key in nested for key in keys)
+        ]
+        for location in ready or list(nested):  # a reference cycle has no innermost file
+            for line in _inline_into(location, nested.pop(location), matched_refs):
+                print(line)
+
+    # The remaining content files touch disjoint sets of files and the work is
+    # I/O-bound, so rewrite them on a thread pool; logs are printed in the parent, in
+    # content-file order.
+    with ThreadPoolExecutor(max_workers=IO_WORKERS) as executor:
+        futures = [
+            executor.submit(_inline_into, location, reusable_keys, matched_refs)
+            for location, reusable_keys in sorted(by_content.items())
+            if location not in candidates
+        ]
+        for future in futures:
+            for line in future.result():
+                print(line)
+
+
+def _delete_one(reusable_key: str) -> str:
+    """Delete a single reusable file and return the log line describing the result."""
+    if not os.path.exists(reusable_key):
+        return f"  [SKIP] File not found on disk: {reusable_key}"
+    try:
+        os.unlink(reusable_key)
+        return f"  [OK]   Deleted: {reusable_key}"
+    except OSError as exc:
+        return f"  [ERROR] Could not delete {reusable_key}: {exc}"
+
+
+def delete_unused(usages: dict[str, list[str]], reusable_keys: set[str]) -> None:
     """
     Delete every reusable file that has zero references in the content directory.
     """
-    unused = {k: v for k, v in usages.items() if len(v) == 0}
+    unused = reusable_keys - usages.keys()
 
     if not unused:
         print("\n[DELETE-UNUSED] No unused reusable files found. Nothing to delete.")
@@ -184,29 +460,30 @@ def delete_unused(usages: dict[str, list[str]]) -> None:
 
     print(f"\n[DELETE-UNUSED] Deleting {len(unused)} unused file(s):\n")
 
-    for reusable_key in sorted(unused):
-        reusable_path = Path(reusable_key)
-        if not reusable_path.exists():
-            print(f"  [SKIP] File not found on disk: {reusable_key}")
-            continue
-        try:
-            reusable_path.unlink()
-            print(f"  [OK]   Deleted: {reusable_key}")
-        except OSError as exc:
-            print(f"  [ERROR] Could not delete {reusable_key}: {exc}")
+    with ThreadPoolExecutor(max_workers=IO_WORKERS) as executor:
+        for line in executor.map(_delete_one, sorted(unused)):
+            print(line)
 
 
 def report(
     usages: dict[str, list[str]],
     missing: set[str],
+    reusable_keys: set[str],
     show_locations: bool = False,
     show_missing: bool = False,
 ) -> None:
     """Print an audit report to stdout."""
+    # Collect the report lines and write them in one call rather than one per line.
+    out: list[str] = []
     errors: list[tuple[str, list[str]]] = []
     info: list[tuple[str, list[str]]] = []
 
-    for file_path, locations in sorted(usages.items()):
+    # Sort alphabetically once; the usage-count ordering below is a stable re-sort of
+    # this list, so files with equal counts stay in alphabetical order.
+    alpha = [(file_path, usages.get(file_path, [])) for file_path in sorted(reusable_keys)]
+    by_count = sorted(alpha, key=lambda item: -len(item[1]))
+
+    for file_path, locations in alpha:
         count = len(locations)
         if count <= 1:
             errors.append((file_path, locations))
@@ -216,49 +493,50 @@ def report(
     # ------------------------------------------------------------------ #
     # Summary section                                                      #
     # ------------------------------------------------------------------ #
-    total = len(usages)
-    print(f"\nReusable file audit — {total} file(s) found\n")
-    print("=" * 60)
+    total = len(reusable_keys)
+    out.append(f"\nReusable file audit — {total} file(s) found\n")
+    out.append("=" * 60)
 
     # ------------------------------------------------------------------ #
     # Error / warning section                                              #
     # ------------------------------------------------------------------ #
     if errors:
-        print(f"\n[ALERT] {len(errors)} file(s) used 0 or 1 time(s):\n")
+        out.append(f"\n[ALERT] {len(errors)} file(s) used 0 or 1 time(s):\n")
         for file_path, locations in errors:
             count = len(locations)
             label = "0 uses" if count == 0 else "1 use"
-            print(f"  [!] {file_path}  ({label})")
+            out.append(f"  [!] {file_path}  ({label})")
             if show_locations and locations:
                 for loc in locations:
-                    print(f"        -> {loc}")
+                    out.append(f"        -> {loc}")
     else:
-        print("\n[OK] All reusable files are used more than once.")
+        out.append("\n[OK] All reusable files are used more than once.")
 
     # ------------------------------------------------------------------ #
     # Missing files section                                                #
     # ------------------------------------------------------------------ #
     if show_missing:
         if missing:
-            print(f"\n[MISSING] {len(missing)} referenced file(s) not found on disk:\n")
+            out.append(f"\n[MISSING] {len(missing)} referenced file(s) not found on disk:\n")
             for ref in sorted(missing):
-                print(f"  [?] {ref}")
+                out.append(f"  [?] {ref}")
         else:
-            print("\n[OK] All referenced reusable files exist on disk.")
+            out.append("\n[OK] All referenced reusable files exist on disk.")
 
     # ------------------------------------------------------------------ #
     # Usage counts                                                         #
     # ------------------------------------------------------------------ #
-    print(f"\n{'File':<55} {'Uses':>5}")
-    print("-" * 62)
-    for file_path, locations in sorted(usages.items(), key=lambda x: -len(x[1])):
+    out.append(f"\n{'File':<55} {'Uses':>5}")
+    out.append("-" * 62)
+    for file_path, locations in by_count:
         count = len(locations)
-        print(f"  {file_path:<53} {count:>5}")
+        out.append(f"  {file_path:<53} {count:>5}")
         if show_locations and locations:
             for loc in sorted(set(locations)):
-                print(f"      -> {loc}")
+                out.append(f"      -> {loc}")
 
-    print()
+    out.append("")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def main() -> None:
@@ -300,6 +578,15 @@ def main() -> None:
         default=False,
         help="Delete reusable Markdown files that are not referenced in any content file.",
     )
+    parser.add_argument(
+        "--cache",
+        metavar="FILE",
+        default=None,
+        help=(
+            "Cache the shortcodes found in each content file in FILE, and skip "
+            "re-reading content files that are unchanged since the previous run."
+        ),
+    )
     args = parser.parse_args()
 
     reusable_dir = Path(args.reusable_dir).expanduser().resolve()
@@ -310,12 +597,22 @@ def main() -> None:
             print(f"ERROR: {label} is not a valid directory: {path}", file=sys.stderr)
             sys.exit(1)
 
-    usages, missing = find_usages(reusable_dir, content_dir)
-    report(usages, missing, show_locations=args.show_locations, show_missing=args.show_missing)
+    cache_file = Path(args.cache).expanduser() if args.cache else None
+
+    usages, missing, reusable_keys, matched_refs = find_usages(
+        reusable_dir, content_dir, cache_file=cache_file
+    )
+    report(
+        usages,
+        missing,
+        reusable_keys,
+        show_locations=args.show_locations,
+        show_missing=args.show_missing,
+    )
     if args.inline_singles:
-        inline_singles(usages)
+        inline_singles(usages, matched_refs)
     if args.delete_unused:
-        delete_unused(usages)
+        delete_unused(usages, reusable_keys)
 
 
 if __name__ == "__main__":
@@ -2,13 +2,21 @@
 Tests for reusable_file_search.py
 """
 
+import json
 import subprocess
 import sys
 from pathlib import Path
 
 import pytest
 
-from reusable_file_search import delete_unused, find_usages, inline_singles, report
+from reusable_file_search import (
+    CHUNK_SIZE,
+    PARALLEL_SCAN_MIN_FILES,
+    delete_unused,
+    find_usages,
+    inline_singles,
+    report,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -55,7 +63,7 @@ class TestFindUsages:
         r = make_reusable(rd, "note.md")
         make_content(cd, "page.md", shortcode("content/reusable/note.md"))
 
-        usages, missing = find_usages(rd, cd)
+        usages, missing, _, _ = find_usages(rd, cd)
 
         assert r.as_posix() in usages
         assert len(usages[r.as_posix()]) == 1
@@ -72,7 +80,7 @@ class TestFindUsages:
         make_content(cd, "page2.md", shortcode(ref))
         make_content(cd, "page3.md", shortcode(ref))
 
-        usages, missing = find_usages(rd, cd)
+        usages, missing, _, _ = find_usages(rd, cd)
 
         assert len(usages[r.as_posix()]) == 3
         assert missing == set()
@@ -85,9 +93,10 @@ class TestFindUsages:
         r = make_reusable(rd, "orphan.md")
         make_content(cd, "page.md", "No shortcodes here.\n")
 
-        usages, missing = find_usages(rd, cd)
+        usages, missing, reusable_keys, _ = find_usages(rd, cd)
 
-        assert usages[r.as_posix()] == []
+        assert r.as_posix() in reusable_keys
+        assert usages.get(r.as_posix(), []) == []
 
     def test_missing_reference_recorded(self, tmp_path):
         rd = tmp_path / "reusable"
@@ -96,7 +105,7 @@ class TestFindUsages:
 
         make_content(cd, "page.md", shortcode("content/reusable/does_not_exist.md"))
 
-        usages, missing = find_usages(rd, cd)
+        usages, missing, _, _ = find_usages(rd, cd)
 
         assert "content/reusable/does_not_exist.md" in missing
 
@@ -109,7 +118,7 @@ class TestFindUsages:
         make_content(cd, "page1.md", shortcode(ref))
         make_content(cd, "page2.md", shortcode(ref))
 
-        _, missing = find_usages(rd, cd)
+        _, missing, _, _ = find_usages(rd, cd)
 
         assert missing == {ref}
 
@@ -123,7 +132,7 @@ class TestFindUsages:
         body = shortcode("content/reusable/alpha.md") + "\n" + shortcode("content/reusable/beta.md")
         make_content(cd, "page.md", body)
 
-        usages, _ = find_usages(rd, cd)
+        usages, _, reusable_keys, _ = find_usages(rd, cd)
 
         assert len(usages[r1.as_posix()]) == 1
         assert len(usages[r2.as_posix()]) == 1
@@ -137,11 +146,54 @@ class TestFindUsages:
         r = make_reusable(sub, "nested.md")
         make_content(cd, "page.md", shortcode("content/reusable/sub/nested.md"))
 
-        usages, missing = find_usages(rd, cd)
+        usages, missing, _, _ = find_usages(rd, cd)
 
         assert len(usages[r.as_posix()]) == 1
         assert missing == set()
 
+    def test_shared_basename_resolved_by_path_suffix(self, tmp_path):
+        rd = tmp_path / "reusable"
+        cd = tmp_path / "content"
+        (rd / "a").mkdir(parents=True); (rd / "b").mkdir(); cd.mkdir()
+
+        ra = make_reusable(rd / "a", "note.md")
+        rb = make_reusable(rd / "b", "note.md")
+        make_content(cd, "page.md", shortcode("content/reusable/b/note.md"))
+
+        usages, missing, _, _ = find_usages(rd, cd)
+
+        assert usages.get(ra.as_posix(), []) == []
+        assert len(usages[rb.as_posix()]) == 1
+        assert missing == set()
+
+    def test_top_level_file_preferred_over_nested_namesake(self, tmp_path):
+        rd = tmp_path / "reusable"
+        cd = tmp_path / "content"
+        (rd / "sub").mkdir(parents=True); cd.mkdir()
+
+        top = make_reusable(rd, "note.md")
+        nested = make_reusable(rd / "sub", "note.md")
+        make_content(cd, "page.md", shortcode("content/reusable/note.md"))
+
+        usages, missing, _, _ = find_usages(rd, cd)
+
+        assert len(usages[top.as_posix()]) == 1
+        assert usages.get(nested.as_posix(), []) == []
+
+    def test_ambiguous_basename_resolves_deterministically(self, tmp_path):
+        rd = tmp_path / "reusable"
+        cd = tmp_path / "content"
+        (rd / "b").mkdir(parents=True); (rd / "a").mkdir(); cd.mkdir()
+
+        ra = make_reusable(rd / "a", "note.md")
+        make_reusable(rd / "b", "note.md")
+        make_content(cd, "page.md", shortcode("content/elsewhere/note.md"))
+
+        usages, missing, _, _ = find_usages(rd, cd)
+
+        assert list(usages) == [ra.as_posix()]
+        assert missing == set()
+
     def test_shortcode_with_spaces_around_equals(self, tmp_path):
         rd = tmp_path / "reusable"
         cd = tmp_path / "content"
@@ -150,12 +202,133 @@ class TestFindUsages:
         r = make_reusable(rd, "note.md")
         make_content(cd, "page.md", shortcode_spaced("content/reusable/note.md"))
 
-        usages, missing = find_usages(rd, cd)
+        usages, missing, _, _ = find_usages(rd, cd)
 
         assert r.as_posix() in usages
         assert len(usages[r.as_posix()]) == 1
         assert missing == set()
 
+    def test_empty_content_file_is_skipped(self, tmp_path):
+        rd = tmp_path / "reusable"
+        cd = tmp_path / "content"
+        rd.mkdir(); cd.mkdir()
+
+        r = make_reusable(rd, "note.md")
+        make_content(cd, "empty.md", "")
+        make_content(cd, "page.md", shortcode("content/reusable/note.md"))
+
+        usages, missing, _, _ = find_usages(rd, cd)
+
+        assert len(usages[r.as_posix()]) == 1
+        assert missing == set()
+
+    def test_shortcodes_near_chunk_boundary_counted_once(self, tmp_path):
+        rd = tmp_path / "reusable"
+        cd = tmp_path / "content"
+        rd.mkdir(); cd.mkdir()
+
+        before = make_reusable(rd, "before.md")
+        across = make_reusable(rd, "across.md")
+        first = shortcode("content/reusable/before.md")
+        second = shortcode("content/reusable/across.md")
+        # The first shortcode ends just before the chunk boundary, the second straddles it.
+        padding = "x" * (CHUNK_SIZE - len(first) - 20)
+        make_content(cd, "big.md", padding + first + "\n" * 5 + second + "\n")
+
+        usages, missing, _, _ = find_usages(rd, cd)
+
+        assert len(usages[before.as_posix()]) == 1
+        assert len(usages[across.as_posix()]) == 1
+        assert missing == set()
+
+    def test_long_shortcode_across_chunk_boundary(self, tmp_path):
+        rd = tmp_path / "reusable"
+        cd = tmp_path / "content"
+        deep = rd / ("d" * 120) / ("e" * 120)
+        deep.mkdir(parents=True); cd.mkdir()
+
+        r = make_reusable(deep, "long_note.md")
+        code = shortcode(f"content/reusable/{'d' * 120}/{'e' * 120}/long_note.md")
+        assert len(code) > 256
+        # The shortcode starts well before the chunk boundary and ends after it.
+        padding = "x" * (CHUNK_SIZE - len(code) + 30)
+        make_content(cd, "big.md", padding + code + "\n")
+
+        usages, missing, _, _ = find_usages(rd, cd)
+
+        assert len(usages[r.as_posix()]) == 1
+        assert missing == set()
+
+    def test_stray_opener_does_not_hold_back_later_chunks(self, tmp_path):
+        rd = tmp_path / "reusable"
+        cd = tmp_path / "content"
+        rd.mkdir(); cd.mkdir()
+
+        r = make_reusable(rd, "note.md")
+        body = (
+            "Type `{{<` to open a shortcode.\n"
+            + "x" * (CHUNK_SIZE * 4)
+            + "\n" + shortcode("content/reusable/note.md") + "\n"
+        )
+        make_content(cd, "big.md", body)
+
+        usages, missing, _, _ = find_usages(rd, cd)
+
+        assert len(usages[r.as_posix()]) == 1
+        assert missing == set()
+
+    def test_other_shortcode_before_first_readfile(self, tmp_path):
+        rd = tmp_path / "reusable"
+        cd = tmp_path / "content"
+        rd.mkdir(); cd.mkdir()
+
+        r = make_reusable(rd, "note.md")
+        body = "{{< note >}}\nIntro.\n{{< /note >}}\n\n" + shortcode("content/reusable/note.md")
+        make_content(cd, "page.md", body)
+
+        usages, missing, _, _ = find_usages(rd, cd)
+
+        assert len(usages[r.as_posix()]) == 1
+        assert missing == set()
+
+    def test_readfile_word_outside_shortcode_before_real_one(self, tmp_path):
+        rd = tmp_path / "reusable"
+        cd = tmp_path / "content"
+        rd.mkdir(); cd.mkdir()
+
+        r1 = make_reusable(rd, "first.md")
+        r2 = make_reusable(rd, "second.md")
+        body = (
+            "Use the readfile shortcode to include files.\n"
+            + shortcode("content/reusable/first.md") + "\n"
+            + "{{< tip >}}readfile again{{< /tip >}}\n"
+            + shortcode("content/reusable/second.md") + "\n"
+        )
+        make_content(cd, "page.md", body)
+
+        usages, missing, _, _ = find_usages(rd, cd)
+
+        assert len(usages[r1.as_posix()]) == 1
+        assert len(usages[r2.as_posix()]) == 1
+        assert missing == set()
+
+    def test_many_content_files_scanned_in_parallel(self, tmp_path):
+        rd = tmp_path / "reusable"
+        cd = tmp_path / "content"
+        rd.mkdir(); cd.mkdir()
+
+        r = make_reusable(rd, "shared.md")
+        orphan = make_reusable(rd, "orphan.md")
+        for i in range(PARALLEL_SCAN_MIN_FILES + 10):
+            make_content(cd, f"page{i}.md", shortcode("content/reusable/shared.md"))
+        make_content(cd, "ghost.md", shortcode("content/reusable/ghost.md"))
+
+        usages, missing, reusable_keys, _ = find_usages(rd, cd)
+
+        assert len(usages[r.as_posix()]) == PARALLEL_SCAN_MIN_FILES + 10
+        assert orphan.as_posix() in reusable_keys
+        assert missing == {"content/reusable/ghost.md"}
+
     def test_readme_file_in_reusable_is_excluded(self, tmp_path):
         rd = tmp_path / "reusable"
         cd = tmp_path / "content"
@@ -164,9 +337,9 @@ class TestFindUsages:
         readme = make_reusable(rd, "README.md")
         make_content(cd, "page.md", shortcode("content/reusable/README.md"))
 
-        usages, missing = find_usages(rd, cd)
+        usages, missing, reusable_keys, _ = find_usages(rd, cd)
 
-        assert readme.as_posix() not in usages
+        assert readme.as_posix() not in reusable_keys
         assert "content/reusable/README.md" not in missing
 
     def test_index_file_in_reusable_is_excluded(self, tmp_path):
@@ -177,9 +350,9 @@ class TestFindUsages:
         index_file = make_reusable(rd, "index.md")
         make_content(cd, "page.md", shortcode("content/reusable/index.md"))
 
-        usages, missing = find_usages(rd, cd)
+        usages, missing, reusable_keys, _ = find_usages(rd, cd)
 
-        assert index_file.as_posix() not in usages
+        assert index_file.as_posix() not in reusable_keys
         assert "content/reusable/index.md" not in missing
 
     def test_content_readme_file_is_not_scanned(self, tmp_path):
@@ -190,11 +363,103 @@ class TestFindUsages:
         reusable_file = make_reusable(rd, "tip.md")
         make_content(cd, "README.md", shortcode("content/reusable/tip.md"))
 
-        usages, missing = find_usages(rd, cd)
+        usages, missing, _, _ = find_usages(rd, cd)
+
+        assert usages.get(reusable_file.as_posix(), []) == []
+        assert missing == set()
+
+
+# ---------------------------------------------------------------------------
+# find_usages with a scan cache
+# ---------------------------------------------------------------------------
+
+
+class TestScanCache:
+    def test_cache_file_written(self, tmp_path):
+        rd = tmp_path / "reusable"
+        cd = tmp_path / "content"
+        rd.mkdir(); cd.mkdir()
+        cache_file = tmp_path / "cache.json"
+
+        make_reusable(rd, "note.md")
+        cp = make_content(cd, "page.md", shortcode("content/reusable/note.md"))
+
+        find_usages(rd, cd, cache_file=cache_file)
+
+        cache = json.loads(cache_file.read_text(encoding="utf-8"))
+        assert cache[cp.as_posix()][2] == ["content/reusable/note.md"]
+
+    def test_unchanged_file_not_rescanned(self, tmp_path):
+        rd = tmp_path / "reusable"
+        cd = tmp_path / "content"
+        rd.mkdir(); cd.mkdir()
+        cache_file = tmp_path / "cache.json"
+
+        note = make_reusable(rd, "note.md")
+        tip = make_reusable(rd, "tip.md")
+        cp = make_content(cd, "page.md", shortcode("content/reusable/note.md"))
+        find_usages(rd, cd, cache_file=cache_file)
+
+        # Point the cached entry at a different reference; an unchanged file must
+        # be served from the cache rather than read again.
+        cache = json.loads(cache_file.read_text(encoding="utf-8"))
+        cache[cp.as_posix()][2] = ["content/reusable/tip.md"]
+        cache_file.write_text(json.dumps(cache), encoding="utf-8")
+
+        usages, _, _, _ = find_usages(rd, cd, cache_file=cache_file)
+
+        assert usages.get(note.as_posix(), []) == []
+        assert len(usages[tip.as_posix()]) == 1
 
-        assert usages[reusable_file.as_posix()] == []
+    def test_changed_file_rescanned(self, tmp_path):
+        rd = tmp_path / "reusable"
+        cd = tmp_path / "content"
+        rd.mkdir(); cd.mkdir()
+        cache_file = tmp_path / "cache.json"
+
+        note = make_reusable(rd, "note.md")
+        cp = make_content(cd, "page.md", "No shortcodes yet.\n")
+        find_usages(rd, cd, cache_file=cache_file)
+
+        cp.write_text(shortcode("content/reusable/note.md"), encoding="utf-8")
+        usages, _, _, _ = find_usages(rd, cd, cache_file=cache_file)
+
+        assert len(usages[note.as_posix()]) == 1
+
+    @pytest.mark.parametrize("bad_refs", ["content/reusable/note.md", 42, [1, 2]])
+    def test_malformed_cache_entry_rescanned(self, tmp_path, bad_refs):
+        rd = tmp_path / "reusable"
+        cd = tmp_path / "content"
+        rd.mkdir(); cd.mkdir()
+        cache_file = tmp_path / "cache.json"
+
+        note = make_reusable(rd, "note.md")
+        cp = make_content(cd, "page.md", shortcode("content/reusable/note.md"))
+        find_usages(rd, cd, cache_file=cache_file)
+
+        cache = json.loads(cache_file.read_text(encoding="utf-8"))
+        cache[cp.as_posix()][2] = bad_refs
+        cache_file.write_text(json.dumps(cache), encoding="utf-8")
+
+        usages, missing, _, _ = find_usages(rd, cd, cache_file=cache_file)
+
+        assert len(usages[note.as_posix()]) == 1
         assert missing == set()
 
+    def test_corrupt_cache_ignored(self, tmp_path):
+        rd = tmp_path / "reusable"
+        cd = tmp_path / "content"
+        rd.mkdir(); cd.mkdir()
+        cache_file = tmp_path / "cache.json"
+        cache_file.write_text("not json", encoding="utf-8")
+
+        note = make_reusable(rd, "note.md")
+        make_content(cd, "page.md", shortcode("content/reusable/note.md"))
+
+        usages, _, _, _ = find_usages(rd, cd, cache_file=cache_file)
+
+        assert len(usages[note.as_posix()]) == 1
+
 
 # ---------------------------------------------------------------------------
 # inline_singles
@@ -212,14 +477,101 @@ class TestInlineSingles:
         ref = "content/reusable/tip.md"
         content_file = make_content(cd, "page.md", f"Before.\n\n{shortcode(ref)}\n\nAfter.\n")
 
-        usages, _ = find_usages(rd, cd)
-        inline_singles(usages)
+        usages, _, _, matched_refs = find_usages(rd, cd)
+        inline_singles(usages, matched_refs)
 
         assert not r.exists(), "Reusable file should be deleted"
         result = content_file.read_text(encoding="utf-8")
         assert "This is the inlined text." in result
         assert "readfile" not in result
 
+    def test_inlines_shortcode_with_spaces_around_equals(self, tmp_path):
+        rd = tmp_path / "reusable"
+        cd = tmp_path / "content"
+        rd.mkdir(); cd.mkdir()
+
+        r = make_reusable(rd, "tip.md", "Spaced tip.\n")
+        content_file = make_content(cd, "page.md", shortcode_spaced("content/reusable/tip.md"))
+
+        usages, _, _, matched_refs = find_usages(rd, cd)
+        inline_singles(usages, matched_refs)
+
+        assert not r.exists()
+        assert content_file.read_text(encoding="utf-8") == "Spaced tip."
+
+    def test_inlines_several_singles_into_one_content_file(self, tmp_path):
+        rd = tmp_path / "reusable"
+        cd = tmp_path / "content"
+        rd.mkdir(); cd.mkdir()
+
+        r1 = make_reusable(rd, "first.md", "First text.\n")
+        r2 = make_reusable(rd, "second.md", "Second text.\n")
+        body = (
+            f"{shortcode('content/reusable/first.md')}\n\n"
+            f"Middle.\n\n"
+            f"{shortcode('content/reusable/second.md')}\n"
+        )
+        content_file = make_content(cd, "page.md", body)
+
+        usages, _, _, matched_refs = find_usages(rd, cd)
+        inline_singles(usages, matched_refs)
+
+        assert not r1.exists()
+        assert not r2.exists()
+        result = content_file.read_text(encoding="utf-8")
+        assert result == "First text.\n\nMiddle.\n\nSecond text.\n"
+
+    def test_inlines_into_many_content_files(self, tmp_path):
+        rd = tmp_path / "reusable"
+        cd = tmp_path / "content"
+        rd.mkdir(); cd.mkdir()
+
+        pages = []
+        for i in range(20):
+            make_reusable(rd, f"tip{i}.md", f"Tip {i}.\n")
+            pages.append(make_content(cd, f"page{i}.md", shortcode(f"content/reusable/tip{i}.md")))
+
+        usages, _, _, matched_refs = find_usages(rd, cd)
+        inline_singles(usages, matched_refs)
+
+        assert list(rd.iterdir()) == []
+        for i, page in enumerate(pages):
+            assert page.read_text(encoding="utf-8") == f"Tip {i}."
+
+    def test_inlines_nested_reusables(self, tmp_path):
+        # reusable_dir inside content_dir: reusable files are scanned as content too.
+        cd = tmp_path / "content"
+        rd = cd / "reusable"
+        rd.mkdir(parents=True)
+
+        a = make_reusable(rd, "a.md", "A starts.\n" + shortcode("content/reusable/b.md") + "\n")
+        b = make_reusable(rd, "b.md", "B text.\n")
+        page = make_content(cd, "page.md", shortcode("content/reusable/a.md") + "\n")
+
+        usages, _, _, matched_refs = find_usages(rd, cd)
+        inline_singles(usages, matched_refs)
+
+        assert not a.exists()
+        assert not b.exists()
+        assert page.read_text(encoding="utf-8") == "A starts.\nB text.\n"
+
+    def test_keeps_reusable_when_shortcode_not_replaced(self, tmp_path, capsys):
+        rd = tmp_path / "reusable"
+        cd = tmp_path / "content"
+        rd.mkdir(); cd.mkdir()
+
+        r = make_reusable(rd, "tip.md", "Tip.\n")
+        content_file = make_content(cd, "page.md", "The shortcode was removed.\n")
+
+        inline_singles(
+            {r.as_posix(): [content_file.as_posix()]},
+            {r.as_posix(): {"content/reusable/tip.md"}},
+        )
+
+        assert r.exists(), "Reusable file should be kept when nothing was inlined"
+        assert content_file.read_text(encoding="utf-8") == "The shortcode was removed.\n"
+        assert "[SKIP]" in capsys.readouterr().out
+
     def test_does_not_inline_multi_use_files(self, tmp_path):
         rd = tmp_path / "reusable"
         cd = tmp_path / "content"
@@ -230,8 +582,8 @@ class TestInlineSingles:
         make_content(cd, "page1.md", shortcode(ref))
         make_content(cd, "page2.md", shortcode(ref))
 
-        usages, _ = find_usages(rd, cd)
-        inline_singles(usages)
+        usages, _, _, matched_refs = find_usages(rd, cd)
+        inline_singles(usages, matched_refs)
 
         assert r.exists(), "Multi-use reusable file should NOT be deleted"
 
@@ -243,8 +595,8 @@ class TestInlineSingles:
         r = make_reusable(rd, "unused.md", "Unused.\n")
         make_content(cd, "page.md", "No shortcodes.\n")
 
-        usages, _ = find_usages(rd, cd)
-        inline_singles(usages)
+        usages, _, _, matched_refs = find_usages(rd, cd)
+        inline_singles(usages, matched_refs)
 
         assert r.exists(), "Unused reusable file should NOT be touched by inline_singles"
 
@@ -254,8 +606,8 @@ class TestInlineSingles:
         rd.mkdir(); cd.mkdir()
 
         make_content(cd, "page.md", "No shortcodes.\n")
-        usages, _ = find_usages(rd, cd)
-        inline_singles(usages)  # should not raise
+        usages, _, _, matched_refs = find_usages(rd, cd)
+        inline_singles(usages, matched_refs)  # should not raise
 
         out = capsys.readouterr().out
         assert "Nothing to inline" in out
@@ -275,8 +627,8 @@ class TestDeleteUnused:
         r = make_reusable(rd, "orphan.md")
         make_content(cd, "page.md", "No shortcodes.\n")
 
-        usages, _ = find_usages(rd, cd)
-        delete_unused(usages)
+        usages, _, reusable_keys, _ = find_usages(rd, cd)
+        delete_unused(usages, reusable_keys)
 
         assert not r.exists()
 
@@ -288,8 +640,8 @@ class TestDeleteUnused:
         r = make_reusable(rd, "used.md")
         make_content(cd, "page.md", shortcode("content/reusable/used.md"))
 
-        usages, _ = find_usages(rd, cd)
-        delete_unused(usages)
+        usages, _, reusable_keys, _ = find_usages(rd, cd)
+        delete_unused(usages, reusable_keys)
 
         assert r.exists()
 
@@ -301,8 +653,8 @@ class TestDeleteUnused:
         r = make_reusable(rd, "used.md")
         make_content(cd, "page.md", shortcode("content/reusable/used.md"))
 
-        usages, _ = find_usages(rd, cd)
-        delete_unused(usages)
+        usages, _, reusable_keys, _ = find_usages(rd, cd)
+        delete_unused(usages, reusable_keys)
 
         out = capsys.readouterr().out
         assert "Nothing to delete" in out
@@ -317,8 +669,8 @@ class TestDeleteUnused:
         unused = make_reusable(rd, "unused.md")
         make_content(cd, "page.md", shortcode("content/reusable/used.md"))
 
-        usages, _ = find_usages(rd, cd)
-        delete_unused(usages)
+        usages, _, reusable_keys, _ = find_usages(rd, cd)
+        delete_unused(usages, reusable_keys)
 
         assert used.exists()
         assert not unused.exists()
@@ -330,16 +682,16 @@ class TestDeleteUnused:
 
 
 class TestReport:
-    def _run_report(self, usages, missing, **kwargs):
-        report(usages, missing, **kwargs)
+    def _run_report(self, usages, missing, reusable_keys, **kwargs):
+        report(usages, missing, reusable_keys, **kwargs)
 
     def test_alert_shown_for_zero_use(self, tmp_path, capsys):
         rd = tmp_path / "reusable"; cd = tmp_path / "content"
         rd.mkdir(); cd.mkdir()
         make_reusable(rd, "orphan.md")
         make_content(cd, "page.md", "No shortcodes.\n")
-        usages, missing = find_usages(rd, cd)
-        self._run_report(usages, missing)
+        usages, missing, reusable_keys, _ = find_usages(rd, cd)
+        self._run_report(usages, missing, reusable_keys)
         out = capsys.readouterr().out
         assert "[ALERT]" in out
 
@@ -350,17 +702,31 @@ class TestReport:
         ref = "content/reusable/shared.md"
         make_content(cd, "page1.md", shortcode(ref))
         make_content(cd, "page2.md", shortcode(ref))
-        usages, missing = find_usages(rd, cd)
-        self._run_report(usages, missing)
+        usages, missing, reusable_keys, _ = find_usages(rd, cd)
+        self._run_report(usages, missing, reusable_keys)
         out = capsys.readouterr().out
         assert "[OK] All reusable files are used more than once" in out
 
+    def test_usage_counts_ordered_by_count_then_name(self, tmp_path, capsys):
+        rd = tmp_path / "reusable"; cd = tmp_path / "content"
+        rd.mkdir(); cd.mkdir()
+        b = make_reusable(rd, "b.md")
+        a = make_reusable(rd, "a.md")
+        c = make_reusable(rd, "c.md")
+        make_content(cd, "page1.md", shortcode("content/reusable/c.md"))
+        make_content(cd, "page2.md", shortcode("content/reusable/c.md"))
+        usages, missing, reusable_keys, _ = find_usages(rd, cd)
+        self._run_report(usages, missing, reusable_keys)
+        table = capsys.readouterr().out.split("-" * 62)[1]
+        positions = [table.index(p.as_posix()) for p in (c, a, b)]
+        assert positions == sorted(positions)
+
     def test_missing_section_shown_with_flag(self, tmp_path, capsys):
         rd = tmp_path / "reusable"; cd = tmp_path / "content"
         rd.mkdir(); cd.mkdir()
         make_content(cd, "page.md", shortcode("content/reusable/ghost.md"))
-        usages, missing = find_usages(rd, cd)
-        self._run_report(usages, missing, show_missing=True)
+        usages, missing, reusable_keys, _ = find_usages(rd, cd)
+        self._run_report(usages, missing, reusable_keys, show_missing=True)
         out = capsys.readouterr().out
         assert "[MISSING]" in out
         assert "ghost.md" in out
@@ -369,8 +735,8 @@ class TestReport:
         rd = tmp_path / "reusable"; cd = tmp_path / "content"
         rd.mkdir(); cd.mkdir()
         make_content(cd, "page.md", shortcode("content/reusable/ghost.md"))
-        usages, missing = find_usages(rd, cd)
-        self._run_report(usages, missing, show_missing=False)
+        usages, missing, reusable_keys, _ = find_usages(rd, cd)
+        self._run_report(usages, missing, reusable_keys, show_missing=False)
         out = capsys.readouterr().out
         assert "[MISSING]" not in out
 
@@ -379,8 +745,8 @@ class TestReport:
         rd.mkdir(); cd.mkdir()
         make_reusable(rd, "tip.md")
         cp = make_content(cd, "page.md", shortcode("content/reusable/tip.md"))
-        usages, missing = find_usages(rd, cd)
-        self._run_report(usages, missing, show_locations=True)
+        usages, missing, reusable_keys, _ = find_usages(rd, cd)
+        self._run_report(usages, missing, reusable_keys, show_locations=True)
         out = capsys.readouterr().out
         assert cp.as_posix() in out
 
@@ -389,8 +755,8 @@ class TestReport:
         rd.mkdir(); cd.mkdir()
         make_reusable(rd, "tip.md")
         cp = make_content(cd, "page.md", shortcode("content/reusable/tip.md"))
-        usages, missing = find_usages(rd, cd)
-        self._run_report(usages, missing, show_locations=False)
+        usages, missing, reusable_keys, _ = find_usages(rd, cd)
+        self._run_report(usages, missing, reusable_keys, show_locations=False)
         out = capsys.readouterr().out
         assert cp.as_posix() not in out
 
@@ -469,3 +835,13 @@ class TestCLI:
         result = self._run(str(rd), str(cd), "--delete-unused")
         assert result.returncode == 0
         assert r.exists()
+
+    def test_cache_flag(self, tmp_path):
+        rd = tmp_path / "reusable"; cd = tmp_path / "content"
+        rd.mkdir(); cd.mkdir()
+        cache_file = tmp_path / "cache.json"
+        make_reusable(rd, "note.md")
+        make_content(cd, "page.md", shortcode("content/reusable/note.md"))
+        result = self._run(str(rd), str(cd), "--cache", str(cache_file))
+        assert result.returncode == 0
+        assert cache_file.exists()